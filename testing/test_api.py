@@ -1,17 +1,35 @@
 #!/usr/bin/env python3
 """
 Comprehensive API endpoint tester for Apicentric Cloud Server
+
+Install dependencies with: pip install -r testing/requirements.txt
 """
 
+import argparse
+import io
+import socket
 import subprocess
 import time
-import requests
-import json
+import httpx
+import orjson
 import sys
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TextIO
+from urllib.parse import urlsplit
 
 API_URL = "http://localhost:8080"
 TOKEN: Optional[str] = None
+VERBOSE = False
+
+# Shared client so every call reuses one pooled connection. HTTP/2 (multiplexed) is only
+# negotiated over https; against the plain http dev server this is HTTP/1.1 keep-alive.
+CLIENT = httpx.Client(
+    http2=True,
+    base_url=API_URL,
+    headers={"Content-Type": "application/json"},
+    limits=httpx.Limits(max_connections=20),
+    timeout=10,
+)
 
 class Colors:
     GREEN = '\033[0;32m'
@@ -20,46 +38,61 @@ class Colors:
     BLUE = '\033[0;34m'
     NC = '\033[0m'
 
-def print_result(success: bool, message: str):
-    if success:
-        print(f"{Colors.GREEN}✓ {message}{Colors.NC}")
-    else:
-        print(f"{Colors.RED}✗ {message}{Colors.NC}")
+OK_PREFIX = f"{Colors.GREEN}✓ "
+FAIL_PREFIX = f"{Colors.RED}✗ "
+SUFFIX = f"{Colors.NC}\n"
+
+def print_result(success: bool, message: str, file: Optional[TextIO] = None):
+    # Emit the whole line in one write; parallel sections pass their own buffer as file
+    (file or sys.stdout).write((OK_PREFIX if success else FAIL_PREFIX) + message + SUFFIX)
+
+def parse_json(response):
+    return orjson.loads(response.content)
+
+def format_json(data) -> str:
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
 
-def api_request(method: str, endpoint: str, data: dict = None, auth: bool = False):
-    headers = {"Content-Type": "application/json"}
+def print_json(data):
+    if VERBOSE:
+        print(format_json(data))
+
+def print_response(response, file: Optional[TextIO] = None):
+    if VERBOSE:
+        print(format_json(parse_json(response)), file=file)
+
+def api_request(method: str, endpoint: str, data: dict = None, auth: bool = False,
+                file: Optional[TextIO] = None):
+    headers = {}
     if auth and TOKEN:
         headers["Authorization"] = f"Bearer {TOKEN}"
     
-    url = f"{API_URL}{endpoint}"
+    method = method.upper()
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers)
-        elif method == "POST":
-            response = requests.post(url, json=data, headers=headers)
-        elif method == "PUT":
-            response = requests.put(url, json=data, headers=headers)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
-        else:
-            raise ValueError(f"Unsupported method: {method}")
-        
-        return response
+        body = orjson.dumps(data) if data is not None and method != "GET" else None
+        return CLIENT.request(method, endpoint, content=body, headers=headers)
     except Exception as e:
-        print(f"{Colors.RED}Error: {e}{Colors.NC}")
+        print(f"{Colors.RED}Error ({method} {endpoint}): {e}{Colors.NC}", file=file)
         return None
 
 def wait_for_server(timeout=30):
     print(f"{Colors.YELLOW}⏳ Waiting for server to start...{Colors.NC}")
-    for i in range(timeout):
+    address = urlsplit(API_URL)
+    port = address.port or (443 if address.scheme == "https" else 80)
+    deadline = time.monotonic() + timeout
+    sleep = 0.025
+    while time.monotonic() < deadline:
         try:
-            response = requests.get(f"{API_URL}/health", timeout=1)
+            # Cheap TCP check first; only issue the HTTP probe once the port accepts
+            socket.create_connection((address.hostname, port), timeout=0.1).close()
+            response = CLIENT.get("/health", timeout=0.5)
             if response.status_code == 200:
                 print(f"{Colors.GREEN}✓ Server is ready{Colors.NC}")
                 return True
-        except:
+        except (OSError, httpx.HTTPError):
             pass
-        time.sleep(1)
+        # Back off from 25ms up to 1s so a fast-starting server is seen quickly
+        time.sleep(min(sleep, max(deadline - time.monotonic(), 0)))
+        sleep = min(sleep * 1.5, 1.0)
     print(f"{Colors.RED}✗ Server failed to start within {timeout} seconds{Colors.NC}")
     return False
 
@@ -70,7 +103,7 @@ def test_health():
     
     response = api_request("GET", "/health")
     if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
+        print_response(response)
         print_result(True, "GET /health")
         return True
     else:
@@ -90,8 +123,8 @@ def test_authentication():
         "password": "testpass123"
     })
     if response and response.status_code in [200, 201]:
-        data = response.json()
-        print(json.dumps(data, indent=2))
+        data = parse_json(response)
+        print_json(data)
         TOKEN = data.get("token")
         print_result(True, "POST /api/auth/register")
     else:
@@ -106,8 +139,8 @@ def test_authentication():
         "password": "testpass123"
     })
     if response and response.status_code == 200:
-        data = response.json()
-        print(json.dumps(data, indent=2))
+        data = parse_json(response)
+        print_json(data)
         TOKEN = data.get("token")
         print_result(True, "POST /api/auth/login")
     else:
@@ -118,7 +151,7 @@ def test_authentication():
     print("\nTesting: GET /api/auth/me")
     response = api_request("GET", "/api/auth/me", auth=True)
     if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
+        print_response(response)
         print_result(True, "GET /api/auth/me")
     else:
         print(f"Status: {response.status_code if response else 'N/A'}")
@@ -128,8 +161,8 @@ def test_authentication():
     print("\nTesting: POST /api/auth/refresh")
     response = api_request("POST", "/api/auth/refresh", auth=True)
     if response and response.status_code == 200:
-        data = response.json()
-        print(json.dumps(data, indent=2))
+        data = parse_json(response)
+        print_json(data)
         new_token = data.get("token")
         if new_token:
             TOKEN = new_token
@@ -147,7 +180,7 @@ def test_service_management():
     print("\nTesting: GET /api/services")
     response = api_request("GET", "/api/services", auth=True)
     if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
+        print_response(response)
         print_result(True, "GET /api/services")
     else:
         print(f"Status: {response.status_code if response else 'N/A'}")
@@ -172,7 +205,7 @@ endpoints:
     
     response = api_request("POST", "/api/services", {"yaml": service_yaml}, auth=True)
     if response and response.status_code in [200, 201]:
-        print(json.dumps(response.json(), indent=2))
+        print_response(response)
         print_result(True, "POST /api/services")
     else:
         print(f"Status: {response.status_code if response else 'N/A'}")
@@ -184,7 +217,7 @@ endpoints:
     print("\nTesting: GET /api/services/test-service")
     response = api_request("GET", "/api/services/test-service", auth=True)
     if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
+        print_response(response)
         print_result(True, "GET /api/services/test-service")
     else:
         print(f"Status: {response.status_code if response else 'N/A'}")
@@ -194,7 +227,7 @@ endpoints:
     print("\nTesting: POST /api/services/test-service/start")
     response = api_request("POST", "/api/services/test-service/start", auth=True)
     if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
+        print_response(response)
         print_result(True, "POST /api/services/test-service/start")
     else:
         print(f"Status: {response.status_code if response else 'N/A'}")
@@ -206,7 +239,7 @@ endpoints:
     print("\nTesting: GET /api/services/test-service/status")
     response = api_request("GET", "/api/services/test-service/status", auth=True)
     if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
+        print_response(response)
         print_result(True, "GET /api/services/test-service/status")
     else:
         print(f"Status: {response.status_code if response else 'N/A'}")
@@ -216,89 +249,50 @@ endpoints:
     print("\nTesting: POST /api/services/test-service/stop")
     response = api_request("POST", "/api/services/test-service/stop", auth=True)
     if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
+        print_response(response)
         print_result(True, "POST /api/services/test-service/stop")
     else:
         print(f"Status: {response.status_code if response else 'N/A'}")
         print_result(False, "POST /api/services/test-service/stop")
 
-def test_logs():
-    print("\n" + "="*50)
-    print("4. REQUEST LOGS API")
-    print("="*50)
-    
-    # Query logs
-    print("\nTesting: GET /api/logs")
-    response = api_request("GET", "/api/logs", auth=True)
-    if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
-        print_result(True, "GET /api/logs")
-    else:
-        print(f"Status: {response.status_code if response else 'N/A'}")
-        print_result(False, "GET /api/logs")
+def report_codegen(response: httpx.Response, out: TextIO):
+    data = parse_json(response)
+    if "data" in data and "code" in data["data"]:
+        print(f"Generated {len(data['data']['code'])} characters of TypeScript code", file=out)
 
-def test_recording():
-    print("\n" + "="*50)
-    print("5. RECORDING API")
-    print("="*50)
-    
-    # Get recording status
-    print("\nTesting: GET /api/recording/status")
-    response = api_request("GET", "/api/recording/status", auth=True)
-    if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
-        print_result(True, "GET /api/recording/status")
-    else:
-        print(f"Status: {response.status_code if response else 'N/A'}")
-        print_result(False, "GET /api/recording/status")
+# (section title, method, path, body, reporter) for phases that are a single authed call,
+# in report order. A reporter replaces the default response dump on success.
+SIMPLE_TESTS = [
+    ("4. REQUEST LOGS API", "GET", "/api/logs", None, None),
+    ("5. RECORDING API", "GET", "/api/recording/status", None, None),
+    ("6. AI GENERATION API", "GET", "/api/ai/config", None, None),
+    ("7. CODE GENERATION API", "POST", "/api/codegen/typescript",
+     {"service_name": "test-service"}, report_codegen),
+    ("8. CONFIGURATION API", "GET", "/api/config", None, None),
+]
 
-def test_ai():
-    print("\n" + "="*50)
-    print("6. AI GENERATION API")
-    print("="*50)
-    
-    # Get AI config
-    print("\nTesting: GET /api/ai/config")
-    response = api_request("GET", "/api/ai/config", auth=True)
-    if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
-        print_result(True, "GET /api/ai/config")
-    else:
-        print(f"Status: {response.status_code if response else 'N/A'}")
-        print_result(False, "GET /api/ai/config")
-
-def test_codegen():
-    print("\n" + "="*50)
-    print("7. CODE GENERATION API")
-    print("="*50)
-    
-    # Generate TypeScript
-    print("\nTesting: POST /api/codegen/typescript")
-    response = api_request("POST", "/api/codegen/typescript", 
-                          {"service_name": "test-service"}, auth=True)
-    if response and response.status_code == 200:
-        data = response.json()
-        if "data" in data and "code" in data["data"]:
-            print(f"Generated {len(data['data']['code'])} characters of TypeScript code")
-        print_result(True, "POST /api/codegen/typescript")
-    else:
-        print(f"Status: {response.status_code if response else 'N/A'}")
-        print_result(False, "POST /api/codegen/typescript")
+# These phases run in parallel, so each buffers its section and returns it for
+# main() to print in one piece instead of interleaving lines across threads.
 
-def test_config():
-    print("\n" + "="*50)
-    print("8. CONFIGURATION API")
-    print("="*50)
+def run_simple(title: str, method: str, path: str, body: Optional[dict],
+               report: Optional[Callable[[httpx.Response, TextIO], None]] = None) -> str:
+    out = io.StringIO()
+    print("\n" + "="*50, file=out)
+    print(title, file=out)
+    print("="*50, file=out)
     
-    # Get config
-    print("\nTesting: GET /api/config")
-    response = api_request("GET", "/api/config", auth=True)
+    print(f"\nTesting: {method} {path}", file=out)
+    response = api_request(method, path, body, auth=True, file=out)
     if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
-        print_result(True, "GET /api/config")
+        if report:
+            report(response, out)
+        else:
+            print_response(response, file=out)
+        print_result(True, f"{method} {path}", file=out)
     else:
-        print(f"Status: {response.status_code if response else 'N/A'}")
-        print_result(False, "GET /api/config")
+        print(f"Status ({method} {path}): {response.status_code if response else 'N/A'}", file=out)
+        print_result(False, f"{method} {path}", file=out)
+    return out.getvalue()
 
 def test_cleanup():
     print("\n" + "="*50)
@@ -309,7 +303,7 @@ def test_cleanup():
     print("\nTesting: DELETE /api/services/test-service")
     response = api_request("DELETE", "/api/services/test-service", auth=True)
     if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
+        print_response(response)
         print_result(True, "DELETE /api/services/test-service")
     else:
         print(f"Status: {response.status_code if response else 'N/A'}")
@@ -319,13 +313,18 @@ def test_cleanup():
     print("\nTesting: POST /api/auth/logout")
     response = api_request("POST", "/api/auth/logout", auth=True)
     if response and response.status_code == 200:
-        print(json.dumps(response.json(), indent=2))
+        print_response(response)
         print_result(True, "POST /api/auth/logout")
     else:
         print(f"Status: {response.status_code if response else 'N/A'}")
         print_result(False, "POST /api/auth/logout")
 
 def main():
+    global VERBOSE
+    parser = argparse.ArgumentParser(description="Apicentric Cloud Server API endpoint tester")
+    parser.add_argument("--verbose", action="store_true", help="pretty-print response bodies")
+    VERBOSE = parser.parse_args().verbose
+    
     print(f"{Colors.BLUE}🚀 Starting API endpoint tests...{Colors.NC}")
     
     # Wait for server
@@ -337,11 +336,13 @@ def main():
     test_health()
     test_authentication()
     test_service_management()
-    test_logs()
-    test_recording()
-    test_ai()
-    test_codegen()
-    test_config()
+    
+    # Read-only phases are independent of each other, so overlap their round-trips
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        reports = list(executor.map(lambda test: run_simple(*test), SIMPLE_TESTS))
+    for report in reports:
+        sys.stdout.write(report)
+    
     test_cleanup()
     
     print("\n" + "="*50)